@@ -45,6 +45,7 @@ from flask import (
     render_template,
     request,
     send_from_directory,
+    url_for,
 )
 from flask_cors import CORS
 from werkzeug.exceptions import NotFound
@@ -68,6 +69,12 @@ logger = logging.getLogger(__name__)
 api_bp = Blueprint("api", __name__, url_prefix="/api")
 
 DEFAULT_ALLOWED_AUDIO_EXTENSIONS = {".mp3", ".wav", ".flac", ".ogg"}
+_STORAGE_PATH_KEYS = ("STORAGE_ROOT", "UPLOAD_DIR", "STEMS_DIR", "MIDI_DIR")
+_DOWNLOAD_CATEGORY_CONFIG_KEYS = {
+    "uploads": "UPLOAD_DIR",
+    "stems": "STEMS_DIR",
+    "midi": "MIDI_DIR",
+}
 
 
 def _parse_bool_env(name: str, default: bool) -> bool:
@@ -117,12 +124,16 @@ def create_app(config_overrides: Optional[Dict[str, object]] = None) -> Flask:
         static_folder=str(project_root / "static"),
     )
     app.config.update(config)
+    # Overrides may supply plain strings; normalise once so request handlers
+    # can use the stored ``Path`` objects directly.
+    for key in _STORAGE_PATH_KEYS:
+        app.config[key] = Path(app.config[key])
 
     _configure_logging()
     _ensure_storage_directories(
-        Path(app.config["UPLOAD_DIR"]),
-        Path(app.config["STEMS_DIR"]),
-        Path(app.config["MIDI_DIR"]),
+        app.config["UPLOAD_DIR"],
+        app.config["STEMS_DIR"],
+        app.config["MIDI_DIR"],
     )
 
     CORS(
@@ -138,8 +149,6 @@ def create_app(config_overrides: Optional[Dict[str, object]] = None) -> Flask:
         },
     )
 
-    app.config.setdefault("MAX_CONTENT_LENGTH", config["MAX_CONTENT_LENGTH"])
-
     app.register_blueprint(api_bp)
 
     @app.get("/")
@@ -154,9 +163,9 @@ def create_app(config_overrides: Optional[Dict[str, object]] = None) -> Flask:
     def health_endpoint():
         """Return service health information for monitoring and orchestration."""
 
-        upload_dir = Path(app.config["UPLOAD_DIR"])
-        stems_dir = Path(app.config["STEMS_DIR"])
-        midi_dir = Path(app.config["MIDI_DIR"])
+        upload_dir = app.config["UPLOAD_DIR"]
+        stems_dir = app.config["STEMS_DIR"]
+        midi_dir = app.config["MIDI_DIR"]
 
         directories = {
             "uploads": upload_dir,
@@ -179,7 +188,7 @@ def create_app(config_overrides: Optional[Dict[str, object]] = None) -> Flask:
 
         health_data = {
             "status": "healthy" if healthy else "degraded",
-            "storage_root": str(Path(app.config["STORAGE_ROOT"]).resolve()),
+            "storage_root": str(app.config["STORAGE_ROOT"].resolve()),
             "directories": directory_status,
             "available_models": get_available_models(),
             "supported_stems": get_supported_stem_types(),
@@ -268,8 +277,8 @@ def separate_endpoint():
         )
 
     job_id = str(uuid.uuid4())
-    upload_dir = Path(current_app.config["UPLOAD_DIR"]) / job_id
-    stems_dir = Path(current_app.config["STEMS_DIR"]) / job_id
+    upload_dir = current_app.config["UPLOAD_DIR"] / job_id
+    stems_dir = current_app.config["STEMS_DIR"] / job_id
     upload_dir.mkdir(parents=True, exist_ok=True)
     stems_dir.mkdir(parents=True, exist_ok=True)
 
@@ -346,7 +355,7 @@ def convert_to_midi_endpoint():
     except ValueError:
         return _create_error_response("'job_id' must be a valid UUID", 400)
 
-    stems_dir = Path(current_app.config["STEMS_DIR"]) / job_id
+    stems_dir = current_app.config["STEMS_DIR"] / job_id
     if not stems_dir.exists():
         return _create_error_response("Job not found", 404)
 
@@ -368,8 +377,9 @@ def convert_to_midi_endpoint():
     stem_paths: Dict[str, str] = {}
     for stem_file in stem_files:
         # Expected naming convention: <base>_stem_<name>.wav
-        parts = stem_file.stem.split("_stem_")
-        stem_name = parts[-1] if len(parts) == 2 else stem_file.stem
+        file_stem = stem_file.stem
+        parts = file_stem.split("_stem_")
+        stem_name = parts[-1] if len(parts) == 2 else file_stem
         stem_paths[stem_name] = str(stem_file)
 
     if requested_stems:
@@ -382,7 +392,7 @@ def convert_to_midi_endpoint():
             )
         stem_paths = {name: stem_paths[name] for name in requested_stems}
 
-    midi_dir = Path(current_app.config["MIDI_DIR"]) / job_id
+    midi_dir = current_app.config["MIDI_DIR"] / job_id
     midi_dir.mkdir(parents=True, exist_ok=True)
     output_midi_path = midi_dir / "combined.mid"
 
@@ -424,15 +434,11 @@ def download_endpoint(job_id: str, category: str, filename: str):
     except ValueError:
         return _create_error_response("'job_id' must be a valid UUID", 400)
 
-    valid_categories = {
-        "uploads": Path(current_app.config["UPLOAD_DIR"]),
-        "stems": Path(current_app.config["STEMS_DIR"]),
-        "midi": Path(current_app.config["MIDI_DIR"]),
-    }
-    if category not in valid_categories:
+    config_key = _DOWNLOAD_CATEGORY_CONFIG_KEYS.get(category)
+    if config_key is None:
         return _create_error_response("Invalid download category", 400)
 
-    base_dir = valid_categories[category] / job_id
+    base_dir = current_app.config[config_key] / job_id
     try:
         return send_from_directory(
             directory=str(base_dir),
@@ -464,7 +470,7 @@ def stream_endpoint(job_id: str, category: str, filename: str):
     if category != "stems":
         return _create_error_response("Streaming is only supported for stems", 400)
 
-    base_dir = Path(current_app.config["STEMS_DIR"]) / job_id
+    base_dir = current_app.config["STEMS_DIR"] / job_id
 
     try:
         return send_from_directory(
@@ -8,6 +8,8 @@ resulting stems to disk.
 from __future__ import annotations
 
 import logging
+import threading
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Tuple
 
@@ -22,11 +24,19 @@ SUPPORTED_FORMATS = [".mp3", ".wav", ".flac", ".ogg"]
 DEFAULT_MODEL = "htdemucs_6s"
 STEM_NAMES = ["drums", "bass", "other", "vocals", "guitar", "piano"]
 _MODEL_CACHE: Dict[Tuple[str, str], torch.nn.Module] = {}
+# Guards ``_MODEL_LOAD_LOCKS``; the per-model locks serialize loading so that
+# only callers of the model being downloaded wait on it.
+_MODEL_CACHE_LOCK = threading.Lock()
+_MODEL_LOAD_LOCKS: Dict[Tuple[str, str], threading.Lock] = {}
 
 
+@lru_cache(maxsize=1)
 def _get_device() -> str:
     """Return the preferred device for computation.
 
+    The result is cached for the lifetime of the process because the
+    available hardware does not change between requests.
+
     Returns
     -------
     str
@@ -65,27 +75,37 @@ def _load_model(model_name: str, device: str) -> torch.nn.Module:
     """
 
     cache_key = (model_name, device)
-    if cache_key in _MODEL_CACHE:
-        cached_model = _MODEL_CACHE[cache_key]
+    cached_model = _MODEL_CACHE.get(cache_key)
+    if cached_model is not None:
+        # The cache key includes the device, so the shared model is already
+        # resident there and must not be mutated per request.
         logger.info("Reusing cached model: %s on device %s", model_name, device)
-        cached_model.to(device)
         return cached_model
 
-    try:
-        logger.info("Loading Demucs model: %s", model_name)
-        model = pretrained.get_model(model_name)
-    except Exception as exc:  # pragma: no cover - defensive logging
-        error_message = (
-            f"Unable to load Demucs model '{model_name}'. Verify the model name "
-            "and network connectivity."
-        )
-        logger.exception(error_message)
-        raise RuntimeError(error_message) from exc
+    with _MODEL_CACHE_LOCK:
+        load_lock = _MODEL_LOAD_LOCKS.setdefault(cache_key, threading.Lock())
+
+    # Concurrent requests must not download or initialize the same model twice.
+    with load_lock:
+        cached_model = _MODEL_CACHE.get(cache_key)
+        if cached_model is not None:
+            return cached_model
+
+        try:
+            logger.info("Loading Demucs model: %s", model_name)
+            model = pretrained.get_model(model_name)
+        except Exception as exc:  # pragma: no cover - defensive logging
+            error_message = (
+                f"Unable to load Demucs model '{model_name}'. Verify the model name "
+                "and network connectivity."
+            )
+            logger.exception(error_message)
+            raise RuntimeError(error_message) from exc
 
-    model.to(device)
-    model.eval()
-    _MODEL_CACHE[cache_key] = model
-    return model
+        model.to(device)
+        model.eval()
+        _MODEL_CACHE[cache_key] = model
+        return model
 
 
 def _validate_input_file(file_path: Path) -> Path:
@@ -179,10 +199,7 @@ def separate_audio(
         raise RuntimeError("Unexpected waveform shape. Expected [channels, samples].")
 
     channels, _ = waveform.shape
-    if channels == 1:
-        waveform = waveform.repeat(2, 1)
-        logger.info("Converted mono audio to stereo for Demucs compatibility.")
-    elif channels > 2:
+    if channels > 2:
         logger.info(
             "Input audio has %s channels; using the first two channels for separation.",
             channels,
@@ -195,6 +212,13 @@ def separate_audio(
         sample_rate = target_sr
         logger.info("Resampled audio to match model samplerate: %s Hz", target_sr)
 
+    if channels == 1:
+        # Broadcast the single channel as a zero-copy view; resampling above
+        # therefore only has to process one channel.
+        waveform = waveform.expand(2, -1)
+        logger.info("Converted mono audio to stereo for Demucs compatibility.")
+
+    input_channels = waveform.shape[0]
     mix = waveform.unsqueeze(0)  # [1, channels, samples]
 
     try:
@@ -215,17 +239,21 @@ def separate_audio(
         logger.exception("Audio separation failed for file: %s", input_path_obj)
         raise RuntimeError("Audio separation failed. Please try again.") from exc
 
+    # The input is no longer needed; release it so only the separated
+    # sources stay resident while the stems are written to disk.
+    del mix, waveform
+
     if separated.dim() != 4:
         raise RuntimeError(
             "Unexpected output shape from Demucs. Expected [batch, stems, channels, samples]."
         )
 
     _, stem_count, stem_channels, stem_samples = separated.shape
-    if stem_channels != waveform.shape[0]:
+    if stem_channels != input_channels:
         logger.warning(
             "Stem channel count (%s) does not match input channels (%s).",
             stem_channels,
-            waveform.shape[0],
+            input_channels,
         )
 
     stem_paths: Dict[str, str] = {}
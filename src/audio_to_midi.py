@@ -23,11 +23,15 @@ import logging
 import os
 import shutil
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
 from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional
 
+import numpy as np
 import pretty_midi
+from pretty_midi.utilities import hz_to_note_number
 from basic_pitch.inference import Model as BasicPitchModel
 from basic_pitch.inference import predict_and_save as basic_pitch_predict_and_save
 from basic_pitch import ICASSP_2022_MODEL_PATH
@@ -44,6 +48,20 @@ GM_PROGRAM_NUMBERS: Dict[str, int | None] = {
     "other": 0,
 }
 MELODIA_STEMS = ["vocals"]
+MAX_TRANSCRIPTION_WORKERS = 4
+# pyin only tracks up to C7 (~2.1 kHz), so higher sample rates add cost
+# without adding usable pitch information.
+PYIN_MAX_SAMPLE_RATE = 22050
+# pyin hop and window sizes in samples at the source sample rate. They are
+# rescaled after downsampling so the analysis keeps the same durations.
+PYIN_HOP_LENGTH = 256
+PYIN_FRAME_LENGTH = 2048
+# The cached Basic Pitch model is shared by every worker thread and is not
+# guaranteed to be thread-safe, so inference calls are serialized.
+_BASIC_PITCH_LOCK = threading.Lock()
+# ``lru_cache`` does not stop concurrent callers from each building the model
+# on a cold cache, so the lookup is serialized to load it only once.
+_BASIC_PITCH_MODEL_LOCK = threading.Lock()
 
 
 def _validate_audio_file(file_path: Path) -> Path:
@@ -146,6 +164,47 @@ def _get_basic_pitch_model() -> Optional[BasicPitchModel]:
         return None
 
 
+@lru_cache(maxsize=1)
+def _get_transcription_executor() -> Optional[ThreadPoolExecutor]:
+    """Return the shared stem transcription pool, or ``None`` on single-core hosts.
+
+    The pool is created on first use and reused by every subsequent call so
+    concurrent requests share a bounded number of worker threads.
+    """
+
+    max_workers = min(os.cpu_count() or 1, MAX_TRANSCRIPTION_WORKERS)
+    if max_workers <= 1:
+        return None
+    return ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="audio_to_midi")
+
+
+@lru_cache(maxsize=1)
+def _get_melodia_class() -> Optional[type]:
+    """Resolve and cache the audio2midi ``Melodia`` class, or ``None`` if missing.
+
+    A failed import is not recorded in ``sys.modules``, so without caching every
+    vocals stem would repeat the full import search before falling back.
+    """
+
+    try:
+        from audio2midi import Melodia  # type: ignore[attr-defined]
+    except ImportError:
+        try:
+            from audio2midi.melodia_pitch_detector import (  # type: ignore[attr-defined]
+                Melodia,
+            )
+        except ImportError:
+            return None
+    return Melodia
+
+
+@lru_cache(maxsize=None)
+def _note_to_hz(note_name: str) -> float:
+    """Return the frequency in Hz of a note name such as ``"C2"``, cached."""
+
+    return float(pretty_midi.note_number_to_hz(pretty_midi.note_name_to_number(note_name)))
+
+
 def _convert_with_basic_pitch(audio_path: Path, stem_name: str) -> pretty_midi.PrettyMIDI:
     """Convert audio to MIDI using Spotify Basic Pitch.
 
@@ -169,23 +228,28 @@ def _convert_with_basic_pitch(audio_path: Path, stem_name: str) -> pretty_midi.P
 
     try:
         logger.info("Running Basic Pitch inference for stem '%s'.", stem_name)
-        with tempfile.TemporaryDirectory(prefix="basic_pitch_") as tmpdir:
+        with _BASIC_PITCH_MODEL_LOCK:
             model = _get_basic_pitch_model()
+        model_path: Optional[Path] = None
+        if model is None:
+            # Only fall back to the raw path when the cached model failed to load.
             model_path = _get_basic_pitch_model_path()
-            if model is None and model_path is None:
+            if model_path is None:
                 raise RuntimeError(
                     "Basic Pitch model unavailable. Ensure 'basic-pitch' extras are installed."
                 )
 
-            basic_pitch_predict_and_save(
-                audio_path_list=[str(audio_path)],
-                output_directory=tmpdir,
-                save_midi=True,
-                sonify_midi=False,
-                save_model_outputs=False,
-                save_notes=False,
-                model_or_model_path=model if model is not None else str(model_path),
-            )
+        with tempfile.TemporaryDirectory(prefix="basic_pitch_") as tmpdir:
+            with _BASIC_PITCH_LOCK:
+                basic_pitch_predict_and_save(
+                    audio_path_list=[str(audio_path)],
+                    output_directory=tmpdir,
+                    save_midi=True,
+                    sonify_midi=False,
+                    save_model_outputs=False,
+                    save_notes=False,
+                    model_or_model_path=model if model is not None else str(model_path),
+                )
             temp_dir = Path(tmpdir)
             midi_candidates = sorted(temp_dir.glob("*_basic_pitch.mid"))
             if not midi_candidates:
@@ -249,15 +313,12 @@ def _convert_with_melodia(audio_path: Path, stem_name: str) -> pretty_midi.Prett
     midi_data: pretty_midi.PrettyMIDI | None = None
 
     try:
-        try:
-            from audio2midi import Melodia  # type: ignore[attr-defined]
-        except ImportError:
-            from audio2midi.melodia_pitch_detector import (  # type: ignore[attr-defined]
-                Melodia,
-            )
+        melodia_cls = _get_melodia_class()
+        if melodia_cls is None:
+            raise ImportError("audio2midi Melodia is not installed.")
 
         logger.info("Running Melodia inference for stem '%s'.", stem_name)
-        melodia = Melodia()
+        melodia = melodia_cls()
         with tempfile.TemporaryDirectory(prefix="melodia_") as tmpdir:
             output_file = Path(tmpdir) / f"{audio_path.stem}_melodia.mid"
             result_path = melodia.predict(
@@ -303,7 +364,6 @@ def _convert_with_librosa_py_in(audio_path: Path, stem_name: str) -> pretty_midi
     """Fallback transcription using ``librosa.pyin`` for monophonic melodies."""
 
     try:
-        import numpy as np
         import librosa
     except ImportError as exc:  # pragma: no cover - dependency missing
         raise RuntimeError(
@@ -317,13 +377,22 @@ def _convert_with_librosa_py_in(audio_path: Path, stem_name: str) -> pretty_midi
         logger.warning("Audio file '%s' is empty. Returning empty MIDI.", audio_path)
         return pretty_midi.PrettyMIDI()
 
-    hop_length = 256
+    hop_length = PYIN_HOP_LENGTH
+    frame_length = PYIN_FRAME_LENGTH
+    if sr > PYIN_MAX_SAMPLE_RATE:
+        scale = PYIN_MAX_SAMPLE_RATE / sr
+        hop_length = max(1, round(hop_length * scale))
+        frame_length = round(frame_length * scale)
+        y = librosa.resample(y, orig_sr=sr, target_sr=PYIN_MAX_SAMPLE_RATE)
+        sr = PYIN_MAX_SAMPLE_RATE
+
     try:
         f0, voiced_flag, _ = librosa.pyin(
             y,
-            fmin=librosa.note_to_hz("C2"),
-            fmax=librosa.note_to_hz("C7"),
+            fmin=_note_to_hz("C2"),
+            fmax=_note_to_hz("C7"),
             sr=sr,
+            frame_length=frame_length,
             hop_length=hop_length,
         )
     except Exception as exc:
@@ -337,64 +406,51 @@ def _convert_with_librosa_py_in(audio_path: Path, stem_name: str) -> pretty_midi
     if f0 is None or voiced_flag is None:
         logger.warning("librosa.pyin returned no F0 track for '%s'.", audio_path)
     else:
-        times = librosa.times_like(f0, sr=sr, hop_length=hop_length)
         frame_duration = hop_length / sr
-
-        current_start: float | None = None
-        current_pitches: list[float] = []
-
-        for idx, (frequency, is_voiced) in enumerate(zip(f0, voiced_flag)):
-            time = times[idx]
-            if is_voiced and frequency is not None and not np.isnan(frequency):
-                if current_start is None:
-                    current_start = time
-                    current_pitches = [frequency]
-                else:
-                    current_pitches.append(frequency)
-            elif current_start is not None:
-                end_time = time
-                _append_note_from_frequencies(instrument, current_start, end_time, current_pitches)
-                current_start = None
-                current_pitches = []
-
-        if current_start is not None:
-            end_time = times[-1] + frame_duration
-            _append_note_from_frequencies(instrument, current_start, end_time, current_pitches)
+        times = np.arange(len(f0), dtype=np.float64) * frame_duration
+
+        # Locate runs of voiced frames with array operations instead of walking
+        # every hop in Python. The mask is written into a buffer padded with
+        # ``False`` on both ends so that each run has both edges.
+        voiced = np.zeros(len(f0) + 2, dtype=bool)
+        np.logical_and(voiced_flag, ~np.isnan(f0), out=voiced[1:-1])
+        edges = np.flatnonzero(np.diff(voiced))
+        run_starts, run_ends = edges[::2], edges[1::2]
+
+        if run_starts.size:
+            median_frequencies = np.array(
+                [np.median(f0[start:end]) for start, end in zip(run_starts, run_ends)]
+            )
+            pitches = np.rint(hz_to_note_number(median_frequencies)).astype(int)
+            start_times = times[run_starts]
+            end_times = times[np.minimum(run_ends, len(times) - 1)]
+            if run_ends[-1] == len(times):
+                end_times[-1] = times[-1] + frame_duration
+            _append_notes(instrument, start_times, end_times, pitches)
 
     _assign_instrument_program(instrument, stem_name)
 
     return midi
 
 
-def _append_note_from_frequencies(
+def _append_notes(
     instrument: pretty_midi.Instrument,
-    start_time: float,
-    end_time: float,
-    frequencies: list[float],
+    start_times: np.ndarray,
+    end_times: np.ndarray,
+    pitches: np.ndarray,
 ) -> None:
-    """Create a PrettyMIDI note from frequency samples if possible."""
-
-    import numpy as np
-    from pretty_midi.utilities import hz_to_note_number
+    """Append fixed-velocity notes described by parallel arrays.
 
-    if not frequencies:
-        return
-
-    median_frequency = float(np.nanmedian(frequencies))
-    if np.isnan(median_frequency):
-        return
-
-    pitch = int(round(hz_to_note_number(median_frequency)))
-    if end_time <= start_time:
-        end_time = start_time + 0.05
+    Every voiced run spans at least one frame, so each end time is strictly
+    after its start time and no minimum duration needs to be enforced.
+    """
 
-    note = pretty_midi.Note(
-        velocity=100,
-        pitch=pitch,
-        start=start_time,
-        end=end_time,
-    )
-    instrument.notes.append(note)
+    for start_time, end_time, pitch in zip(
+        start_times.tolist(), end_times.tolist(), pitches.tolist()
+    ):
+        instrument.notes.append(
+            pretty_midi.Note(velocity=100, pitch=pitch, start=start_time, end=end_time)
+        )
 
 
 def convert_stem_to_midi(stem_path: str, stem_name: str, output_dir: str) -> str:
@@ -436,13 +492,11 @@ def convert_stem_to_midi(stem_path: str, stem_name: str, output_dir: str) -> str
         else:
             midi_data = _convert_with_basic_pitch(audio_path, normalized_stem)
 
-        base_output_file = output_path_obj / f"{audio_path.stem}_midi_{normalized_stem}.mid"
-        output_file = base_output_file
+        output_name = f"{audio_path.stem}_midi_{normalized_stem}"
+        output_file = output_path_obj / f"{output_name}.mid"
         suffix_counter = 1
         while output_file.exists():
-            output_file = base_output_file.with_name(
-                f"{base_output_file.stem}-{suffix_counter}{base_output_file.suffix}"
-            )
+            output_file = output_path_obj / f"{output_name}-{suffix_counter}.mid"
             suffix_counter += 1
 
         midi_data.write(str(output_file))
@@ -493,7 +547,7 @@ def combine_midi_files(
 
     for path in midi_paths:
         candidate = Path(path).expanduser().resolve()
-        if not candidate.exists() or not candidate.is_file() or candidate.suffix.lower() not in {".mid", ".midi"}:
+        if candidate.suffix.lower() not in {".mid", ".midi"} or not candidate.is_file():
             invalid_paths.append(str(path))
         else:
             resolved_paths.append(candidate)
@@ -525,7 +579,7 @@ def combine_midi_files(
                         first_path,
                         initial_tempo,
                     )
-        except Exception as exc:  # pragma: no cover - defensive guard
+        except (IndexError, ValueError, ZeroDivisionError) as exc:  # pragma: no cover - defensive guard
             logger.warning(
                 "Unable to retrieve tempo changes from '%s': %s", first_path, exc
             )
@@ -534,7 +588,7 @@ def combine_midi_files(
         try:
             output_midi = pretty_midi.PrettyMIDI(initial_tempo=initial_tempo)
             tempo_preserved = True
-        except Exception as exc:  # pragma: no cover - defensive guard
+        except (ValueError, ZeroDivisionError) as exc:  # pragma: no cover - defensive guard
             logger.warning(
                 "Failed to initialize combined MIDI with tempo %.2f BPM from '%s': %s",
                 initial_tempo,
@@ -590,6 +644,11 @@ def convert_stems_to_combined_midi(
 ) -> str:
     """Convert multiple stems and merge them into a single MIDI file.
 
+    Stems are transcribed concurrently on a shared pool of up to
+    :data:`MAX_TRANSCRIPTION_WORKERS` threads so Melodia/librosa work and
+    MIDI file I/O overlap with Basic Pitch inference. Track order in the
+    combined file follows the iteration order of ``stem_paths``.
+
     Parameters
     ----------
     stem_paths : dict[str, str]
@@ -605,20 +664,38 @@ def convert_stems_to_combined_midi(
     Raises
     ------
     ValueError
-        If any stem path is invalid.
+        If ``stem_paths`` is empty or any stem path is invalid.
     RuntimeError
         If transcription fails for any stem.
     IOError
         If writing intermediate or final MIDI files fails.
     """
 
+    if not stem_paths:
+        raise ValueError("At least one stem must be provided for conversion.")
+
     temp_dir = Path(tempfile.mkdtemp(prefix="audio_to_midi_"))
     midi_files: List[str] = []
+    executor = _get_transcription_executor() if len(stem_paths) > 1 else None
 
     try:
-        for stem_name, path in stem_paths.items():
-            midi_file = convert_stem_to_midi(path, stem_name, str(temp_dir))
-            midi_files.append(midi_file)
+        if executor is not None:
+            futures = [
+                executor.submit(convert_stem_to_midi, path, stem_name, str(temp_dir))
+                for stem_name, path in stem_paths.items()
+            ]
+            try:
+                midi_files = [future.result() for future in futures]
+            finally:
+                # On failure, drop queued stems and let running ones finish
+                # before the temporary directory is removed.
+                for future in futures:
+                    future.cancel()
+                wait(futures)
+        else:
+            for stem_name, path in stem_paths.items():
+                midi_file = convert_stem_to_midi(path, stem_name, str(temp_dir))
+                midi_files.append(midi_file)
 
         combined_path = combine_midi_files(midi_files, output_path)
         return combined_path
@@ -125,13 +125,17 @@ def _prepare_stem_outputs(stem_paths: Dict[str, str]) -> Tuple[List[Optional[str
 
     for stem_name in STEM_ORDER:
         stem_path = stem_paths.get(stem_name)
-        if stem_path and Path(stem_path).exists():
+        human_size: Optional[str] = None
+        if stem_path:
+            # A single ``stat`` call both checks existence and reads the size.
             try:
-                file_size = Path(stem_path).stat().st_size
-                human_size = _format_file_size(file_size)
+                human_size = _format_file_size(Path(stem_path).stat().st_size)
+            except FileNotFoundError:
+                pass
             except OSError:
-                file_size = 0
                 human_size = "Unknown size"
+
+        if human_size is not None:
             ordered_paths.append(stem_path)
             summary_lines.append(f"- **{stem_name.title()}**: {human_size}")
         else:
@@ -155,14 +159,15 @@ def _build_stem_display_entries(stem_paths: Dict[str, str]) -> List[Dict[str, An
         entry: Dict[str, Any] = {"stem": name, "path": path}
 
         try:
-            path_obj = Path(path)
-            if path_obj.exists():
-                size_bytes = path_obj.stat().st_size
-                entry["size_bytes"] = size_bytes
-                entry["size_readable"] = _format_file_size(size_bytes)
+            size_bytes = Path(path).stat().st_size
+        except FileNotFoundError:
+            pass
         except OSError:
             entry["size_bytes"] = None
             entry["size_readable"] = "Unknown size"
+        else:
+            entry["size_bytes"] = size_bytes
+            entry["size_readable"] = _format_file_size(size_bytes)
 
         entries.append(entry)
         seen.add(name)
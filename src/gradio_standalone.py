@@ -26,8 +26,8 @@ AUTH_RAW = os.getenv("GRADIO_AUTH", "")
 def _parse_auth(raw: str) -> Optional[Tuple[str, str]]:
     """Return a ``(username, password)`` tuple parsed from ``raw`` if valid."""
 
-    if raw and ":" in raw:
-        username, password = raw.split(":", 1)
+    username, separator, password = (raw or "").partition(":")
+    if separator:
         return username.strip(), password.strip()
     return None
 
@@ -66,8 +66,8 @@ GRADIO_AUTH_RAW = os.getenv("GRADIO_AUTH", "")
 def _parse_auth(raw: str) -> Optional[Tuple[str, str]]:
     """Parse ``username:password`` from *raw* and return ``None`` if invalid."""
 
-    if raw and ":" in raw:
-        username, password = raw.split(":", 1)
+    username, separator, password = (raw or "").partition(":")
+    if separator:
         return username.strip(), password.strip()
     return None
 
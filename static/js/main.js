@@ -7,6 +7,7 @@
         audioPlayers: new Map(),
         realGlassInstance: null,
         isProcessing: false,
+        progressPercent: null,
     };
 
     const API_BASE = document.body.dataset.apiBase || '/api';
@@ -192,14 +193,14 @@
             return;
         }
 
-        if (value === null) {
-            elements.progressFill.style.width = '25%';
-            elements.uploadProgress.setAttribute('aria-valuenow', '25');
+        // Upload progress events fire far more often than the rounded
+        // percentage changes; skip the style/attribute writes until it moves.
+        const percent = value === null ? 25 : Math.round(Math.max(0, Math.min(1, value)) * 100);
+        if (percent === state.progressPercent) {
             return;
         }
+        state.progressPercent = percent;
 
-        const clamped = Math.max(0, Math.min(1, value));
-        const percent = Math.round(clamped * 100);
         elements.progressFill.style.width = `${percent}%`;
         elements.uploadProgress.setAttribute('aria-valuenow', String(percent));
     }
@@ -255,13 +256,22 @@
         return `${value.toFixed(value >= 10 ? 0 : 2)} ${units[exponent]}`;
     }
 
+    // Formatted labels only depend on whole seconds, so each is built once.
+    const formattedTimes = new Map();
+
     function formatTime(seconds) {
         if (!Number.isFinite(seconds) || seconds < 0) {
             return '0:00';
         }
-        const minutes = Math.floor(seconds / 60);
-        const secs = Math.floor(seconds % 60);
-        return `${minutes}:${secs.toString().padStart(2, '0')}`;
+        const wholeSeconds = Math.floor(seconds);
+        let formatted = formattedTimes.get(wholeSeconds);
+        if (formatted === undefined) {
+            const minutes = Math.floor(wholeSeconds / 60);
+            const secs = wholeSeconds % 60;
+            formatted = `${minutes}:${secs.toString().padStart(2, '0')}`;
+            formattedTimes.set(wholeSeconds, formatted);
+        }
+        return formatted;
     }
 
     function clearResults() {
@@ -411,21 +421,30 @@
             showStatus(`Error loading ${name} stem. Try downloading instead.`, 'error');
         });
 
+        // timeupdate fires several times per second, but the seek bar and
+        // label only change once per whole second of playback.
+        let displayedSecond = -1;
+        let isSeeking = false;
         audio.addEventListener('timeupdate', () => {
-            if (!seekBar._isSeeking) {
-                seekBar.value = Math.floor(audio.currentTime);
+            const second = Math.floor(audio.currentTime);
+            if (second === displayedSecond) {
+                return;
+            }
+            displayedSecond = second;
+            if (!isSeeking) {
+                seekBar.value = second;
             }
             currentTime.textContent = formatTime(audio.currentTime);
         });
 
         seekBar.addEventListener('input', () => {
-            seekBar._isSeeking = true;
+            isSeeking = true;
             currentTime.textContent = formatTime(Number(seekBar.value));
         });
 
         seekBar.addEventListener('change', () => {
             audio.currentTime = Number(seekBar.value);
-            seekBar._isSeeking = false;
+            isSeeking = false;
         });
 
         volumeSlider.addEventListener('input', () => {
@@ -486,7 +505,7 @@
 
     function pauseAllPlayers(exceptName = null) {
         state.audioPlayers.forEach((player, name) => {
-            if (name === exceptName) {
+            if (name === exceptName || player.audio.paused) {
                 return;
             }
             player.audio.pause();
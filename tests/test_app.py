@@ -214,8 +214,21 @@ def test_validate_audio_file():
 
 
 @pytest.mark.unit
-def test_build_download_url():
-    pytest.skip("TODO: implement test_build_download_url")
+def test_build_download_url(app_instance):
+    """Download URLs are relative by default and absolute when configured."""
+
+    from src.app import _build_download_url
+
+    job_id = "123e4567-e89b-12d3-a456-426614174000"
+
+    with app_instance.test_request_context("/"):
+        assert _build_download_url(job_id, "midi", "song.mid") == f"/api/download/{job_id}/midi/song.mid"
+
+        app_instance.config["ABSOLUTE_URLS"] = True
+        assert (
+            _build_download_url(job_id, "midi", "song.mid")
+            == f"http://localhost/api/download/{job_id}/midi/song.mid"
+        )
 
 
 @pytest.mark.integration
@@ -6,6 +6,7 @@ audio files.
 
 from __future__ import annotations
 
+import threading
 from pathlib import Path
 from typing import Dict
 
@@ -83,6 +84,44 @@ def test_get_available_models() -> None:
     assert isinstance(models, list)
 
 
+def test_load_model_cache_hit_not_blocked_by_other_download(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A slow model download must not stall requests for an already cached model."""
+
+    download_started = threading.Event()
+    release_download = threading.Event()
+
+    def slow_get_model(name: str) -> torch.nn.Module:  # pragma: no cover - stub
+        download_started.set()
+        release_download.wait(timeout=10)
+        return torch.nn.Linear(1, 1)
+
+    cached = torch.nn.Linear(1, 1)
+    monkeypatch.setattr(audio_separation.pretrained, "get_model", slow_get_model)
+    monkeypatch.setattr(audio_separation, "_MODEL_CACHE", {("cached", "cpu"): cached})
+    monkeypatch.setattr(audio_separation, "_MODEL_LOAD_LOCKS", {})
+
+    results: Dict[str, torch.nn.Module] = {}
+
+    def load_cached() -> None:
+        results["cached"] = audio_separation._load_model("cached", "cpu")
+
+    loader = threading.Thread(target=audio_separation._load_model, args=("slow", "cpu"))
+    loader.start()
+    try:
+        assert download_started.wait(timeout=10)
+        cache_hit = threading.Thread(target=load_cached)
+        cache_hit.start()
+        cache_hit.join(timeout=2)
+        # The download is still in progress, so the cache hit must not wait on it.
+        assert not cache_hit.is_alive()
+        assert results["cached"] is cached
+    finally:
+        release_download.set()
+        loader.join(timeout=10)
+
+    assert ("slow", "cpu") in audio_separation._MODEL_CACHE
+
+
 @pytest.mark.skip(reason="Requires Demucs model download and longer runtime.")
 def test_separate_audio_success(sample_audio_file: Path, tmp_path: Path) -> None:
     """Integration test for successful audio separation using Demucs."""
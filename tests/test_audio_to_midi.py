@@ -6,10 +6,14 @@ and Melodia APIs to avoid dependencies on model downloads during CI/CD.
 
 from __future__ import annotations
 
-import sys
+import threading
+import time
+import wave
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import Dict, Iterator, List
 
+import numpy as np
 import pretty_midi
 import pytest
 import torch
@@ -160,13 +164,129 @@ def test_convert_with_melodia_success(monkeypatch: pytest.MonkeyPatch, sample_wa
             midi.instruments.append(inst)
             return midi
 
-    monkeypatch.setitem(sys.modules, "audio2midi", type("mod", (), {"Melodia": DummyMelodia}))
+    monkeypatch.setattr(audio_to_midi, "_get_melodia_class", lambda: DummyMelodia)
 
     midi = audio_to_midi._convert_with_melodia(sample_wav_file, "vocals")
     assert midi.instruments
     assert midi.instruments[0].program == 0
 
 
+def _run_py_in_with_contour(
+    monkeypatch: pytest.MonkeyPatch,
+    f0: np.ndarray,
+    voiced_flag: np.ndarray,
+) -> pretty_midi.PrettyMIDI:
+    """Run the pyin fallback with librosa returning the given F0 contour."""
+
+    librosa = pytest.importorskip("librosa")
+    sample_rate = audio_to_midi.PYIN_MAX_SAMPLE_RATE
+    monkeypatch.setattr(
+        librosa, "load", lambda *args, **kwargs: (np.zeros(4096, dtype=np.float32), sample_rate)
+    )
+    monkeypatch.setattr(librosa, "pyin", lambda *args, **kwargs: (f0, voiced_flag, None))
+    return audio_to_midi._convert_with_librosa_py_in(Path("contour.wav"), "vocals")
+
+
+def test_librosa_py_in_groups_voiced_runs(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Voiced runs should become one note each with exact frame-aligned bounds."""
+
+    nan = np.nan
+    f0 = np.array([nan, 440.0, 446.0, nan, 220.0, nan, 329.63, nan, 110.0, 110.0])
+    voiced_flag = np.array([False, True, True, True, True, False, True, False, True, True])
+
+    midi = _run_py_in_with_contour(monkeypatch, f0, voiced_flag)
+
+    frame = audio_to_midi.PYIN_HOP_LENGTH / audio_to_midi.PYIN_MAX_SAMPLE_RATE
+    notes = [(note.pitch, note.start, note.end) for note in midi.instruments[0].notes]
+    expected = [
+        (69, 1 * frame, 3 * frame),  # split by a NaN frame inside the voiced region
+        (57, 4 * frame, 5 * frame),  # single frame right after the NaN
+        (64, 6 * frame, 7 * frame),  # isolated single frame
+        (45, 8 * frame, 10 * frame),  # run reaching the last frame
+    ]
+    assert len(notes) == len(expected)
+    for (pitch, start, end), (expected_pitch, expected_start, expected_end) in zip(notes, expected):
+        assert pitch == expected_pitch
+        assert start == pytest.approx(expected_start)
+        assert end == pytest.approx(expected_end)
+
+
+def test_librosa_py_in_all_unvoiced(monkeypatch: pytest.MonkeyPatch) -> None:
+    """An entirely unvoiced contour should produce an empty instrument."""
+
+    f0 = np.full(8, np.nan)
+    voiced_flag = np.zeros(8, dtype=bool)
+
+    midi = _run_py_in_with_contour(monkeypatch, f0, voiced_flag)
+
+    assert len(midi.instruments) == 1
+    assert midi.instruments[0].notes == []
+
+
+@pytest.fixture()
+def melody_wav_44k(tmp_path: Path) -> Path:
+    """Write a 44.1 kHz mono WAV with two tones separated by silence."""
+
+    sample_rate = 44100
+
+    def tone(frequency: float, seconds: float) -> np.ndarray:
+        t = np.arange(int(sample_rate * seconds)) / sample_rate
+        return 0.5 * np.sin(2 * np.pi * frequency * t)
+
+    signal = np.concatenate([tone(440.0, 0.6), np.zeros(int(sample_rate * 0.2)), tone(220.0, 0.4)])
+    file_path = tmp_path / "melody_44k.wav"
+    with wave.open(str(file_path), "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes((signal * 32767).astype("<i2").tobytes())
+    return file_path
+
+
+def test_librosa_py_in_downsampling_keeps_frame_durations(monkeypatch: pytest.MonkeyPatch, melody_wav_44k: Path) -> None:
+    """Downsampled pyin analysis should keep the native-rate hop and window durations."""
+
+    librosa = pytest.importorskip("librosa")
+    captured = {}
+
+    def fake_pyin(y: np.ndarray, **kwargs):  # pragma: no cover - stub
+        captured.update(kwargs)
+        n_frames = 1 + len(y) // kwargs["hop_length"]
+        return np.full(n_frames, 440.0), np.ones(n_frames, dtype=bool), None
+
+    monkeypatch.setattr(librosa, "pyin", fake_pyin)
+
+    midi = audio_to_midi._convert_with_librosa_py_in(melody_wav_44k, "vocals")
+
+    sr = captured["sr"]
+    assert sr == audio_to_midi.PYIN_MAX_SAMPLE_RATE
+    assert captured["hop_length"] / sr == pytest.approx(audio_to_midi.PYIN_HOP_LENGTH / 44100)
+    assert captured["frame_length"] / sr == pytest.approx(audio_to_midi.PYIN_FRAME_LENGTH / 44100)
+    (note,) = midi.instruments[0].notes
+    assert note.end == pytest.approx(1.2, abs=captured["hop_length"] / sr * 2)
+
+
+@pytest.mark.slow
+def test_librosa_py_in_downsampling_matches_native_rate(monkeypatch: pytest.MonkeyPatch, melody_wav_44k: Path) -> None:
+    """Notes from a 44.1 kHz input should not move when pyin runs on downsampled audio."""
+
+    pytest.importorskip("librosa")
+
+    def transcribe() -> List[tuple]:
+        midi = audio_to_midi._convert_with_librosa_py_in(melody_wav_44k, "vocals")
+        return [(note.pitch, note.start, note.end) for note in midi.instruments[0].notes]
+
+    downsampled = transcribe()
+    monkeypatch.setattr(audio_to_midi, "PYIN_MAX_SAMPLE_RATE", 10**9)
+    native = transcribe()
+
+    native_hop = audio_to_midi.PYIN_HOP_LENGTH / 44100
+    assert [pitch for pitch, _, _ in downsampled] == [pitch for pitch, _, _ in native] == [69, 57]
+    for (_, start, end), (_, native_start, native_end) in zip(downsampled, native):
+        assert start == pytest.approx(native_start, abs=native_hop)
+        assert end == pytest.approx(native_end, abs=native_hop)
+
+
 def test_convert_stem_to_midi_output_file_created(monkeypatch: pytest.MonkeyPatch, sample_wav_file: Path, tmp_path: Path) -> None:
     """Conversion should create a MIDI file on disk."""
 
@@ -245,6 +365,123 @@ def test_convert_stems_to_combined_midi_cleanup(monkeypatch: pytest.MonkeyPatch,
         audio_to_midi.convert_stems_to_combined_midi({"piano": str(sample_wav_file)}, str(tmp_path / "out.mid"))
 
 
+def test_convert_stems_to_combined_midi_empty_stems(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """An empty stem mapping should fail before any temporary directory is created."""
+
+    def fail_mkdtemp(*args, **kwargs):  # pragma: no cover - stub
+        raise AssertionError("temporary directory should not be created")
+
+    monkeypatch.setattr(audio_to_midi.tempfile, "mkdtemp", fail_mkdtemp)
+
+    with pytest.raises(ValueError):
+        audio_to_midi.convert_stems_to_combined_midi({}, str(tmp_path / "out.mid"))
+
+
+@pytest.fixture()
+def pooled_executor(monkeypatch: pytest.MonkeyPatch) -> Iterator[ThreadPoolExecutor]:
+    """Force the concurrent stem path regardless of the host's CPU count."""
+
+    executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="test_audio_to_midi")
+    monkeypatch.setattr(audio_to_midi, "_get_transcription_executor", lambda: executor)
+    yield executor
+    executor.shutdown(wait=True)
+
+
+def test_convert_stems_to_combined_midi_preserves_stem_order(
+    monkeypatch: pytest.MonkeyPatch, pooled_executor: ThreadPoolExecutor, tmp_path: Path
+) -> None:
+    """Concurrent transcription should keep tracks in ``stem_paths`` order."""
+
+    programs = {"piano": 0, "guitar": 24, "bass": 33}
+    # Earlier stems finish last so completion order differs from input order.
+    delays = {"piano": 0.2, "guitar": 0.1, "bass": 0.0}
+
+    def fake_convert(stem_path: str, stem_name: str, output_dir: str) -> str:  # pragma: no cover - stub
+        time.sleep(delays[stem_name])
+        midi = pretty_midi.PrettyMIDI()
+        instrument = pretty_midi.Instrument(program=programs[stem_name], name=stem_name)
+        instrument.notes.append(pretty_midi.Note(velocity=90, pitch=60, start=0, end=1))
+        midi.instruments.append(instrument)
+        output_file = Path(output_dir) / f"{stem_name}.mid"
+        midi.write(str(output_file))
+        return str(output_file)
+
+    monkeypatch.setattr(audio_to_midi, "convert_stem_to_midi", fake_convert)
+
+    stem_paths = {name: str(tmp_path / f"{name}.wav") for name in programs}
+    result = audio_to_midi.convert_stems_to_combined_midi(stem_paths, str(tmp_path / "out.mid"))
+    combined = pretty_midi.PrettyMIDI(result)
+    assert [instrument.program for instrument in combined.instruments] == list(programs.values())
+
+
+def test_convert_stems_to_combined_midi_failure_waits_for_running_stems(
+    monkeypatch: pytest.MonkeyPatch, pooled_executor: ThreadPoolExecutor, tmp_path: Path
+) -> None:
+    """A failing stem should propagate only after in-flight stems stop using the temp dir."""
+
+    temp_dirs: List[str] = []
+    finished: Dict[str, bool] = {}
+
+    def fake_convert(stem_path: str, stem_name: str, output_dir: str) -> str:  # pragma: no cover - stub
+        temp_dirs.append(output_dir)
+        if stem_name == "bass":
+            raise RuntimeError("bass transcription failed")
+        time.sleep(0.2)
+        output_file = Path(output_dir) / f"{stem_name}.mid"
+        # Fails if the temporary directory was removed while this stem ran.
+        pretty_midi.PrettyMIDI().write(str(output_file))
+        finished[stem_name] = True
+        return str(output_file)
+
+    monkeypatch.setattr(audio_to_midi, "convert_stem_to_midi", fake_convert)
+
+    stem_paths = {name: str(tmp_path / f"{name}.wav") for name in ("bass", "piano", "guitar")}
+    with pytest.raises(RuntimeError, match="bass transcription failed"):
+        audio_to_midi.convert_stems_to_combined_midi(stem_paths, str(tmp_path / "out.mid"))
+
+    assert finished.get("piano") is True
+    assert not Path(temp_dirs[0]).exists()
+
+
+def test_basic_pitch_model_loaded_once_across_pool(
+    monkeypatch: pytest.MonkeyPatch, pooled_executor: ThreadPoolExecutor, tmp_path: Path
+) -> None:
+    """Concurrent stems on a cold cache should construct the Basic Pitch model once."""
+
+    constructions: List[threading.Thread] = []
+
+    class SlowModel:  # pragma: no cover - stub
+        def __init__(self, model_path: Path) -> None:
+            time.sleep(0.2)
+            constructions.append(threading.current_thread())
+
+    def fake_predict_and_save(audio_path_list: List[str], output_directory: str, **kwargs) -> None:  # pragma: no cover - stub
+        midi = pretty_midi.PrettyMIDI()
+        instrument = pretty_midi.Instrument(program=0)
+        instrument.notes.append(pretty_midi.Note(velocity=90, pitch=60, start=0, end=1))
+        midi.instruments.append(instrument)
+        stem = Path(audio_path_list[0]).stem
+        midi.write(str(Path(output_directory) / f"{stem}_basic_pitch.mid"))
+
+    monkeypatch.setattr(audio_to_midi, "BasicPitchModel", SlowModel)
+    monkeypatch.setattr(audio_to_midi, "basic_pitch_predict_and_save", fake_predict_and_save)
+    monkeypatch.setattr(audio_to_midi, "_get_basic_pitch_model_path", lambda: tmp_path / "model")
+
+    stem_paths = {}
+    for name in ("piano", "guitar", "bass", "other"):
+        stem_file = tmp_path / f"{name}.wav"
+        stem_file.write_bytes(b"")
+        stem_paths[name] = str(stem_file)
+
+    audio_to_midi._get_basic_pitch_model.cache_clear()
+    try:
+        audio_to_midi.convert_stems_to_combined_midi(stem_paths, str(tmp_path / "out.mid"))
+    finally:
+        audio_to_midi._get_basic_pitch_model.cache_clear()
+
+    assert len(constructions) == 1
+
+
 def test_get_supported_stem_types() -> None:
     """Ensure supported stem types are exposed."""
 